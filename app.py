@@ -1,10 +1,20 @@
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from zoneinfo import ZoneInfo
+import hashlib
 import random
 import pandas as pd
 import streamlit as st
 from supabase import create_client
 from streamlit_cookies_manager import EncryptedCookieManager
 
+from src.conjugation import CONJ_FORMS
+from src.quiz_state import pack_quiz, question_from_ids, unpack_quiz
+from src.quiz_token import decode_quiz_token, encode_quiz_token
+from src.session_store import FileSessionStore, SessionStateBackend, SQLiteSessionStore
+from src.vocab import VocabStore
+from src.wrong_codec import ANSWER_FIELDS, count_wrong, decode_wrong_list, encode_wrong_list
+
 cookies = EncryptedCookieManager(
     prefix="hatena_jlpt/",
     password=st.secrets.get("COOKIE_PASSWORD", "change-me-please")  # secrets에 넣는 걸 추천
@@ -61,10 +71,36 @@ def get_authed_sb():
 NAVER_TALK_URL = "https://talk.naver.com/W45141"
 LEVEL = "N4"
 N = 10
-QUESTION_TYPES = ["reading", "meaning"]
+QUESTION_TYPES = ["reading", "meaning", "conjugation"]  # conjugation → CONJ_FORMS 중 하나
+POS_MODES = ["i_adj", "na_adj", "mix"]  # ⚠️ 순서 = 쿠키 토큰의 mode 코드
 mode_label_map = {"i_adj": "い형용사", "na_adj": "な형용사", "mix": "형용사 혼합"}
 pos_label_for_table = {"i_adj": "い형용사", "na_adj": "な형용사", "mix": "혼합"}
 
+
+# ============================================================
+# ✅ 세션 상태 외부 저장소 (레플리카 공유/재시작 복구)
+#   secrets: SESSION_BACKEND = "sqlite" | "file" | "none"
+#            SESSION_STORE_PATH = 공유 볼륨 경로 (기본: ./.session_store)
+# ============================================================
+SNAPSHOT_VERSION = 1
+
+
+@st.cache_resource
+def get_session_backend():
+    kind = st.secrets.get("SESSION_BACKEND", "sqlite")
+    if kind == "none":
+        return None
+
+    root = Path(st.secrets.get("SESSION_STORE_PATH", Path(__file__).resolve().parent / ".session_store"))
+    if kind == "file":
+        store = FileSessionStore(root)
+    else:
+        store = SQLiteSessionStore(root / "sessions.sqlite3")
+    return SessionStateBackend(store, delay=float(st.secrets.get("SESSION_SAVE_DELAY_SEC", 1.0)))
+
+
+session_backend = get_session_backend()
+
 # ============================================================
 # ✅ 로그인 UI
 # ============================================================
@@ -169,23 +205,33 @@ def require_login():
 # ============================================================
 # ✅ DB 저장/조회 함수 (반드시 sb_authed로 호출)
 # ============================================================
-def save_attempt_to_db(sb_authed, user_id, level, pos_mode, quiz_len, score, wrong_list):
+def save_attempt_to_db(sb_authed, user_id, level, pos_mode, quiz_len, score, wrong_list, word_ids=None,
+                       challenge_id=None):
+    """
+    wrong_list: v1 압축 형태 권장 (src/wrong_codec.encode_wrong_list)
+    word_ids: 출제된 단어 id 전체 (단어별 난이도 집계용, sql/word_difficulty.sql 적용 필요)
+    challenge_id: 오늘의 챌린지일 때만 (sql/daily_challenge.sql 적용 필요)
+    """
     payload = {
         "user_id": user_id,
         "level": level,
         "pos_mode": pos_mode,
         "quiz_len": int(quiz_len),
         "score": int(score),
-        "wrong_count": int(len(wrong_list)),
-        "wrong_list": wrong_list,  # jsonb
+        "wrong_count": int(count_wrong(wrong_list)),
+        "wrong_list": wrong_list,  # jsonb (v1: {"v": 1, "w": [[No, word_id, qtype, picked_id], ...]})
     }
+    if challenge_id:
+        payload["challenge_id"] = challenge_id
+    if word_ids:
+        payload["word_ids"] = [int(w) for w in word_ids]  # smallint[]
     sb_authed.table("quiz_attempts").insert(payload).execute()
 
 
 def fetch_recent_attempts(sb_authed, user_id, limit=10):
     return (
         sb_authed.table("quiz_attempts")
-        .select("created_at, level, pos_mode, quiz_len, score, wrong_count")
+        .select("created_at, level, pos_mode, quiz_len, score, wrong_count, wrong_list")
         .eq("user_id", user_id)
         .order("created_at", desc=True)
         .limit(limit)
@@ -193,6 +239,117 @@ def fetch_recent_attempts(sb_authed, user_id, limit=10):
     )
 
 
+# ============================================================
+# ✅ 리더보드/반 통계 (sql/leaderboard.sql 트리거가 증분 집계한 테이블만 조회)
+# ============================================================
+LEADERBOARD_TTL_SEC = 60
+LEADERBOARD_PERIODS = {"week": "이번 주", "month": "이번 달"}
+
+
+def today_kst():
+    return datetime.now(ZoneInfo("Asia/Seoul")).date()
+
+
+def current_period_start(period_type: str) -> str:
+    # DB 트리거와 같은 기준: Asia/Seoul, 주=월요일 시작
+    today = today_kst()
+    if period_type == "week":
+        return (today - timedelta(days=today.weekday())).isoformat()
+    return today.replace(day=1).isoformat()
+
+
+@st.cache_data(ttl=LEADERBOARD_TTL_SEC, show_spinner=False)
+def fetch_leaderboard(_sb_authed, period_type, period_start, level, limit=10):
+    """
+    ✅ 프로세스 전체(모든 세션) 공유 캐시: TTL 동안 접속자가 몇 명이든 DB 조회는 1번
+    _sb_authed: 캐시 키에서 제외 (결과는 누가 조회하든 동일)
+    """
+    top = (
+        _sb_authed.table("user_period_stats")
+        .select("user_id, display_name, attempts, total_questions, total_correct, best_score")
+        .eq("period_type", period_type)
+        .eq("period_start", period_start)
+        .eq("level", level)
+        .order("total_correct", desc=True)
+        .limit(limit)
+        .execute()
+    )
+    cohort = (
+        _sb_authed.table("cohort_period_stats")
+        .select("learners, attempts, total_questions, total_correct")
+        .eq("period_type", period_type)
+        .eq("period_start", period_start)
+        .eq("level", level)
+        .limit(1)
+        .execute()
+    )
+    return top.data or [], (cohort.data[0] if cohort.data else None)
+
+
+def render_leaderboard(sb_authed, user_id):
+    st.subheader("🏆 랭킹")
+    period_type = st.radio(
+        "기간",
+        options=list(LEADERBOARD_PERIODS),
+        format_func=lambda x: LEADERBOARD_PERIODS[x],
+        horizontal=True,
+        key="leaderboard_period",
+        label_visibility="collapsed",
+    )
+
+    try:
+        top, cohort = fetch_leaderboard(sb_authed, period_type, current_period_start(period_type), LEVEL)
+    except Exception as e:
+        st.info("랭킹을 불러오지 못했습니다. (sql/leaderboard.sql 적용/RLS 확인 필요)")
+        st.write(getattr(e, "args", e))
+        return
+
+    if cohort:
+        rate = cohort["total_correct"] / cohort["total_questions"] if cohort["total_questions"] else 0
+        c1, c2, c3 = st.columns(3)
+        c1.metric("참여 학습자", f"{cohort['learners']}명")
+        c2.metric("전체 응시", f"{cohort['attempts']}회")
+        c3.metric("전체 정답률", f"{rate*100:.0f}%")
+
+    if not top:
+        st.info("아직 이 기간의 기록이 없습니다.")
+        return
+
+    for rank, r in enumerate(top, start=1):
+        me = " ← 나" if r["user_id"] == user_id else ""
+        st.write(
+            f"{rank}. **{r['display_name']}**{me}  —  정답 {r['total_correct']}개 "
+            f"/ {r['attempts']}회 응시 (최고 {r['best_score']}점)"
+        )
+    st.caption(f"{LEADERBOARD_TTL_SEC}초마다 갱신됩니다.")
+
+
+# ============================================================
+# ✅ 오답 표시
+# ============================================================
+def render_wrong_entry(w):
+    """오답 1개 (이번 퀴즈 오답 노트 / DB 기록 오답 보기 공용)"""
+    if w["단어"] is None:
+        st.markdown(f"**Q{w['No']}** — (단어장에서 찾을 수 없는 단어입니다)\n\n---")
+        return
+    st.markdown(
+        f"""
+**Q{w['No']}**
+
+- 문제: {w['문제']}
+- ❌ 내 답: **{w['내 답']}**
+- ✅ 정답: **{w['정답']}**
+
+📌 단어 정리  
+- 표기: **{w['단어']}**  
+- 읽기: {w['읽기']}  
+- 뜻: {w['뜻']}
+
+---
+"""
+    )
+
+
 # ============================================================
 # ✅ 네이버톡 배너 (제출 후만)
 # ============================================================
@@ -330,6 +487,7 @@ with colB:
         try:
             cookies["access_token"] = ""
             cookies["refresh_token"] = ""
+            cookies["quiz_token"] = ""
             cookies.save()
         except Exception:
             pass
@@ -338,11 +496,18 @@ with colB:
         for k in [
             "user", "access_token", "refresh_token",
             "quiz", "answers", "submitted", "wrong_list",
-            "quiz_version", "pos_mode", "saved_this_attempt",
-            "history", "wrong_counter", "total_counter",
+            "quiz_version", "pos_mode", "saved_this_attempt", "challenge_id", "vocab",
+            "history", "wrong_counter", "total_counter", "counted_quiz_version",
         ]:
             st.session_state.pop(k, None)
 
+        # 4) ✅ 외부 저장 스냅샷 제거
+        if session_backend is not None:
+            try:
+                session_backend.delete(user_id)
+            except Exception:
+                pass
+
         st.rerun()
 
 
@@ -352,13 +517,37 @@ with colB:
 BASE_DIR = Path(__file__).resolve().parent
 CSV_PATH = BASE_DIR / "data" / "words_adj_300.csv"
 
-df = pd.read_csv(CSV_PATH)
-if len(df.columns) == 1 and "\t" in df.columns[0]:
-    df = pd.read_csv(CSV_PATH, sep="\t")
 
-df.columns = df.columns.astype(str).str.replace("\ufeff", "", regex=False).str.strip()
 
-pool = df[df["level"] == LEVEL].copy()
+@st.cache_resource
+def get_vocab_store():
+    # 프로세스당 1개: 파일 감시 스레드가 바뀐 단어장을 새 스냅샷으로 교체 (재시작 X)
+    return VocabStore(CSV_PATH, interval=float(st.secrets.get("VOCAB_RELOAD_SEC", 5.0)), min_words=N)
+
+
+vocab_store = get_vocab_store()
+
+
+def use_vocab(snapshot):
+    """
+    이 세션이 쓸 단어장 스냅샷 고정 (진행 중인 퀴즈는 만들어진 스냅샷 기준으로 계속)
+    세션이 참조를 놓으면 지난 스냅샷은 자동 해제된다
+    """
+    global df, pool, FORMS
+    st.session_state.vocab = snapshot
+    df = snapshot.df
+    pool = snapshot.pools.get(LEVEL, df.iloc[0:0])
+    FORMS = snapshot.forms
+
+
+def use_latest_vocab():
+    # 새 퀴즈를 만들 때만 최신 단어장으로 갈아탄다
+    if st.session_state.get("vocab") is not vocab_store.current():
+        use_vocab(vocab_store.current())
+
+
+use_vocab(st.session_state.get("vocab") or vocab_store.current())
+
 if len(pool) < N:
     st.error(f"단어가 부족합니다: pool={len(pool)}")
     st.stop()
@@ -366,7 +555,10 @@ if len(pool) < N:
 # ============================================================
 # ✅ 퀴즈 로직
 # ============================================================
-def get_base_pool_for_mode(mode: str) -> pd.DataFrame:
+def get_base_pool_for_mode(mode: str, snapshot=None) -> pd.DataFrame:
+    """snapshot: 특정 단어장 스냅샷 기준 (없으면 이 세션이 고정한 단어장)"""
+    snapshot = snapshot or st.session_state.vocab
+    pool = snapshot.pools.get(LEVEL, snapshot.df.iloc[0:0])
     if mode == "i_adj":
         return pool[pool["pos"] == "i_adj"].copy()
     if mode == "na_adj":
@@ -374,52 +566,51 @@ def get_base_pool_for_mode(mode: str) -> pd.DataFrame:
     return pool[pool["pos"].isin(["i_adj", "na_adj"])].copy()
 
 
-def make_question(row: pd.Series, base_pool: pd.DataFrame) -> dict:
-    qtype = random.choice(QUESTION_TYPES)
+def make_question(row: pd.Series, base_pool: pd.DataFrame, rng=random, snapshot=None) -> dict:
+    snapshot = snapshot or st.session_state.vocab
+    vocab_df, forms = snapshot.df, snapshot.forms
+    qtype = rng.choice(QUESTION_TYPES)
+
+    if qtype == "conjugation":
+        if row["word_id"] in forms:
+            # ✅ 활용형: 미리 계산한 표에서 같은 단어의 다른 활용형을 오답으로 (조회만)
+            qtype = rng.choice(CONJ_FORMS)
+            correct_id = CONJ_FORMS.index(qtype)
+            choice_ids = rng.sample([i for i in range(len(CONJ_FORMS)) if i != correct_id], 3) + [correct_id]
+            rng.shuffle(choice_ids)
+            return question_from_ids(vocab_df, row["word_id"], qtype, choice_ids, forms)
+        qtype = rng.choice(["reading", "meaning"])
 
     target_pos = row["pos"]
     same_pos_pool = base_pool[base_pool["pos"] == target_pos]
 
-    if qtype == "reading":
-        prompt = f"{row['jp_word']}의 발음은?"
-        correct = row["reading"]
-        candidates = (
-            same_pos_pool[same_pos_pool["reading"] != correct]["reading"]
-            .dropna()
-            .drop_duplicates()
-            .tolist()
-        )
-    else:
-        prompt = f"{row['jp_word']}의 뜻은?"
-        correct = row["meaning"]
-        candidates = (
-            same_pos_pool[same_pos_pool["meaning"] != correct]["meaning"]
-            .dropna()
-            .drop_duplicates()
-            .tolist()
-        )
+    field = ANSWER_FIELDS[qtype]
+    correct = row[field]
+
+    # ✅ 보기는 word_id로 뽑는다 (DB/세션 스냅샷에는 id만 저장)
+    candidates = (
+        same_pos_pool[same_pos_pool[field] != correct]
+        .dropna(subset=[field])
+        .drop_duplicates(subset=[field])["word_id"]
+        .tolist()
+    )
 
     if len(candidates) < 3:
         st.error(f"오답 후보 부족: pos={target_pos}, 후보={len(candidates)}개")
         st.stop()
 
-    wrongs = random.sample(candidates, 3)
-    choices = wrongs + [correct]
-    random.shuffle(choices)
+    choice_ids = rng.sample(candidates, 3) + [row["word_id"]]
+    rng.shuffle(choice_ids)
 
-    return {
-        "prompt": prompt,
-        "choices": choices,
-        "correct_text": correct,
-        "jp_word": row["jp_word"],
-        "reading": row["reading"],
-        "meaning": row["meaning"],
-        "pos": row["pos"],
-    }
+    return question_from_ids(vocab_df, row["word_id"], qtype, choice_ids)
 
 
-def build_quiz(mode: str) -> list:
-    base_pool = get_base_pool_for_mode(mode)
+def build_quiz(mode: str, rng=random, snapshot=None) -> list:
+    """
+    rng: random.Random(seed)를 넘기면 같은 seed → 같은 퀴즈 (오늘의 챌린지)
+    snapshot: 이 단어장 스냅샷으로 출제 (없으면 이 세션이 고정한 단어장)
+    """
+    base_pool = get_base_pool_for_mode(mode, snapshot)
 
     if mode == "mix":
         i_pool = base_pool[base_pool["pos"] == "i_adj"].copy()
@@ -429,16 +620,20 @@ def build_quiz(mode: str) -> list:
             st.error(f"혼합 모드 단어 부족: i={len(i_pool)}, na={len(na_pool)}")
             st.stop()
 
-        sampled = pd.concat([i_pool.sample(n=5), na_pool.sample(n=5)], ignore_index=True)
-        sampled = sampled.sample(frac=1).reset_index(drop=True)
+        sampled = pd.concat(
+            [i_pool.sample(n=5, random_state=rng.randrange(2**32)),
+             na_pool.sample(n=5, random_state=rng.randrange(2**32))],
+            ignore_index=True,
+        )
+        sampled = sampled.sample(frac=1, random_state=rng.randrange(2**32)).reset_index(drop=True)
     else:
         filtered = base_pool[base_pool["pos"] == mode].copy()
         if len(filtered) < N:
             st.error(f"단어가 부족합니다: mode={mode}, pool={len(filtered)}")
             st.stop()
-        sampled = filtered.sample(n=N).reset_index(drop=True)
+        sampled = filtered.sample(n=N, random_state=rng.randrange(2**32)).reset_index(drop=True)
 
-    return [make_question(sampled.iloc[i], base_pool) for i in range(len(sampled))]
+    return [make_question(sampled.iloc[i], base_pool, rng, snapshot) for i in range(len(sampled))]
 
 
 def build_quiz_from_wrongs(wrong_list: list, mode: str) -> list:
@@ -454,9 +649,219 @@ def build_quiz_from_wrongs(wrong_list: list, mode: str) -> list:
     return [make_question(retry_df.iloc[i], base_pool) for i in range(len(retry_df))]
 
 
+# ============================================================
+# ✅ 오늘의 챌린지: (날짜, 레벨, 유형, 단어장 버전) → 항상 같은 퀴즈, 프로세스당 1번만 생성
+#   단어장이 하루 중간에 바뀌면 다른 퀴즈가 되므로 버전까지 id에 넣는다
+#   → 문항별 통계(challenge_question_stats)가 서로 다른 문제를 같은 q_no로 섞지 않음
+# ============================================================
+CHALLENGE_STATS_TTL_SEC = 60
+
+
+def make_challenge_id(day: str, level: str, mode: str, vocab_version: int) -> str:
+    return f"{day}:{level}:{mode}:{vocab_version:08x}"
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_daily_challenge(challenge_id: str) -> list:
+    """
+    challenge_id만으로 퀴즈가 정해진다 (세션이 고정한 단어장/전역값과 무관)
+    → id에 들어있는 버전의 단어장 스냅샷으로 출제
+    """
+    _, _, mode, version = challenge_id.split(":")
+    snapshot = vocab_store.get(int(version, 16))
+    if snapshot is None:
+        st.error("오늘의 챌린지 단어장을 찾지 못했습니다. (단어장이 방금 교체됨) 다시 시도해주세요.")
+        st.stop()
+
+    # hash()는 프로세스마다 달라지므로 sha256으로 seed 고정 → 레플리카끼리도 같은 퀴즈
+    seed = int.from_bytes(hashlib.sha256(challenge_id.encode("utf-8")).digest()[:8], "big")
+    return build_quiz(mode, random.Random(seed), snapshot)
+
+
+@st.cache_data(ttl=CHALLENGE_STATS_TTL_SEC, show_spinner=False)
+def fetch_challenge_stats(_sb_authed, challenge_id: str) -> dict:
+    """문항번호 → (응시자 수, 정답 수). 모든 세션 공유 캐시"""
+    res = (
+        _sb_authed.table("challenge_question_stats")
+        .select("q_no, seen, correct")
+        .eq("challenge_id", challenge_id)
+        .execute()
+    )
+    return {r["q_no"]: (r["seen"], r["correct"]) for r in (res.data or [])}
+
+
+def render_challenge_stats(sb_authed, challenge_id):
+    st.subheader("📅 오늘의 챌린지 문항별 정답률")
+    try:
+        stats = fetch_challenge_stats(sb_authed, challenge_id)
+    except Exception as e:
+        st.info("챌린지 통계를 불러오지 못했습니다. (sql/daily_challenge.sql 적용/RLS 확인 필요)")
+        st.write(getattr(e, "args", e))
+        return
+
+    if not stats:
+        st.info("아직 집계된 응시자가 없습니다.")
+        return
+
+    for idx, q in enumerate(st.session_state.quiz):
+        seen, correct = stats.get(idx + 1, (0, 0))
+        rate = correct / seen if seen else 0
+        mine = "✅" if st.session_state.answers[idx] == q["correct_text"] else "❌"
+        st.write(f"{mine} Q{idx+1}. {q['jp_word']}  —  전체 정답률 {rate*100:.0f}% ({seen}명)")
+    st.caption(f"{CHALLENGE_STATS_TTL_SEC}초마다 갱신됩니다.")
+
+
+# ============================================================
+# ✅ 세션 스냅샷 저장/복원 (문제는 word_id로만 저장 → 작고, 단어장에서 복원)
+# ============================================================
+def build_session_snapshot() -> dict:
+    return {
+        "v": SNAPSHOT_VERSION,
+        "pos_mode": st.session_state.pos_mode,
+        "quiz_version": st.session_state.quiz_version,
+        "counted_quiz_version": st.session_state.counted_quiz_version,
+        "submitted": st.session_state.submitted,
+        "saved_this_attempt": st.session_state.saved_this_attempt,
+        "challenge_id": st.session_state.challenge_id,
+        "vocab_version": st.session_state.vocab.version,
+        "quiz": pack_quiz(st.session_state.quiz, st.session_state.answers),
+        "history": st.session_state.history,
+        "wrong_counter": st.session_state.wrong_counter,
+        "total_counter": st.session_state.total_counter,
+    }
+
+
+def apply_restored_quiz(quiz, answers, quiz_version):
+    st.session_state.quiz = quiz
+    st.session_state.answers = answers
+    st.session_state.quiz_version = quiz_version
+
+    # 라디오 위젯 선택값도 되살린다 (index=None 위젯이라 경고 없음)
+    for idx, picked in enumerate(answers):
+        if picked is not None:
+            st.session_state[f"q_{quiz_version}_{idx}"] = picked
+
+
+def restore_session_snapshot():
+    # 새 세션일 때만 (history는 첫 실행에 반드시 생기므로 표시로 사용)
+    if session_backend is None or "history" in st.session_state:
+        return
+
+    try:
+        snap = session_backend.load(user_id)
+    except Exception:
+        # 저장소 오류 → 새 퀴즈로 시작
+        return
+    if not snap or snap.get("v") != SNAPSHOT_VERSION:
+        return
+
+    # 누적 통계는 단어 표기(jp_word) 기준이라 단어장 버전과 무관하게 복원
+    st.session_state.history = snap["history"]
+    st.session_state.wrong_counter = snap["wrong_counter"]
+    st.session_state.total_counter = snap["total_counter"]
+
+    # 쿠키 토큰으로 이미 퀴즈를 복원했으면 그쪽(이 브라우저 탭 기준)을 우선
+    if "quiz" in st.session_state:
+        return
+
+    # word_id = 행 위치 → 다른 버전 단어장으로 풀면 엉뚱한 단어/답이 된다 → 같은 버전일 때만 복원
+    snapshot = vocab_store.get(snap.get("vocab_version"))
+    if snapshot is None:
+        return
+    try:
+        quiz, answers = unpack_quiz(snap["quiz"], snapshot.df, snapshot.forms)
+    except Exception:
+        return
+
+    st.session_state.pos_mode = snap["pos_mode"]
+    st.session_state.submitted = snap["submitted"]
+    st.session_state.saved_this_attempt = snap["saved_this_attempt"]
+    st.session_state.challenge_id = snap.get("challenge_id")
+    st.session_state.counted_quiz_version = snap.get("counted_quiz_version")
+    use_vocab(snapshot)
+    apply_restored_quiz(quiz, answers, snap["quiz_version"])
+
+
+# ============================================================
+# ✅ 새로고침 복구: 진행 중인 퀴즈를 쿠키 토큰으로 (DB 조회/문제 재생성 없음)
+# ============================================================
+EPOCH = date(1970, 1, 1)
+
+
+def challenge_day_of(challenge_id) -> int:
+    if not challenge_id:
+        return 0
+    return (date.fromisoformat(challenge_id.split(":")[0]) - EPOCH).days
+
+
+def restore_quiz_from_cookie():
+    if "quiz" in st.session_state:
+        return
+
+    tok = decode_quiz_token(cookies.get("quiz_token"), user_id)
+    if tok is None or tok["mode"] >= len(POS_MODES):
+        return
+    # 그 퀴즈를 만든 단어장 버전이 이 프로세스에 살아있을 때만 (현재 버전이 같으면 그것도 포함)
+    # word_id = 행 위치 → 다른 버전으로 풀면 고른 답/제출 상태가 안 푼 퀴즈에 붙는다 → 새 퀴즈로 시작
+    snapshot = vocab_store.get(tok["vocab_version"])
+    if snapshot is None:
+        return
+    try:
+        quiz, answers = unpack_quiz(tok["packed"], snapshot.df, snapshot.forms)
+    except Exception:
+        # 단어장 변경 등 → 새 퀴즈로 시작
+        return
+
+    mode = POS_MODES[tok["mode"]]
+    use_vocab(snapshot)
+    st.session_state.pos_mode = mode
+    st.session_state.submitted = tok["submitted"]
+    st.session_state.saved_this_attempt = tok["saved"]
+    st.session_state.challenge_id = (
+        make_challenge_id(
+            (EPOCH + timedelta(days=tok["challenge_day"])).isoformat(), LEVEL, mode, tok["vocab_version"]
+        )
+        if tok["challenge_day"] else None
+    )
+    # 제출된 퀴즈는 원래 세션에서 이미 누적 통계에 반영됨 → 복원 후 다시 세지 않게
+    st.session_state.counted_quiz_version = tok["quiz_version"] if tok["submitted"] else None
+    apply_restored_quiz(quiz, answers, tok["quiz_version"])
+
+
+def save_quiz_cookie():
+    if "quiz" not in st.session_state:
+        return
+    token = encode_quiz_token(
+        pack_quiz(st.session_state.quiz, st.session_state.answers),
+        user_id=user_id,
+        vocab_version=st.session_state.vocab.version,
+        mode=POS_MODES.index(st.session_state.pos_mode),
+        quiz_version=st.session_state.quiz_version,
+        submitted=st.session_state.submitted,
+        saved=st.session_state.saved_this_attempt,
+        challenge_day=challenge_day_of(st.session_state.challenge_id),
+    )
+    # 바뀌었을 때만 저장 (cookies.save()는 매번 컴포넌트를 다시 그린다)
+    if cookies.get("quiz_token") != token:
+        cookies["quiz_token"] = token
+        cookies.save()
+
+
+def save_session_snapshot():
+    if session_backend is None or "quiz" not in st.session_state:
+        return
+    try:
+        session_backend.save(user_id, build_session_snapshot())
+    except Exception:
+        pass
+
+
 # ============================================================
 # ✅ 세션 초기화
 # ============================================================
+restore_quiz_from_cookie()
+restore_session_snapshot()
+
 if "pos_mode" not in st.session_state:
     st.session_state.pos_mode = "mix"
 if "quiz_version" not in st.session_state:
@@ -467,6 +872,8 @@ if "wrong_list" not in st.session_state:
     st.session_state.wrong_list = []
 if "saved_this_attempt" not in st.session_state:
     st.session_state.saved_this_attempt = False
+if "challenge_id" not in st.session_state:
+    st.session_state.challenge_id = None
 
 # 누적(세션) 통계
 if "history" not in st.session_state:
@@ -475,8 +882,12 @@ if "wrong_counter" not in st.session_state:
     st.session_state.wrong_counter = {}
 if "total_counter" not in st.session_state:
     st.session_state.total_counter = {}
+# 누적 통계에 이미 반영한 퀴즈 (quiz_version 기준)
+if "counted_quiz_version" not in st.session_state:
+    st.session_state.counted_quiz_version = None
 
 if "quiz" not in st.session_state:
+    use_latest_vocab()
     st.session_state.quiz = build_quiz(st.session_state.pos_mode)
 
 # ============================================================
@@ -484,18 +895,20 @@ if "quiz" not in st.session_state:
 # ============================================================
 selected = st.radio(
     "출제 유형",
-    options=["i_adj", "na_adj", "mix"],
+    options=POS_MODES,
     format_func=lambda x: mode_label_map[x],
     horizontal=True,
-    index=["i_adj", "na_adj", "mix"].index(st.session_state.pos_mode),
+    index=POS_MODES.index(st.session_state.pos_mode),
 )
 
 if selected != st.session_state.pos_mode:
     st.session_state.pos_mode = selected
+    use_latest_vocab()
     st.session_state.quiz = build_quiz(selected)
     st.session_state.submitted = False
     st.session_state.wrong_list = []
     st.session_state.saved_this_attempt = False
+    st.session_state.challenge_id = None
     st.session_state.quiz_version += 1
     st.rerun()
 
@@ -505,10 +918,12 @@ st.divider()
 col1, col2 = st.columns(2)
 with col1:
     if st.button("🔄 새 문제(랜덤 10문항)", use_container_width=True):
+        use_latest_vocab()
         st.session_state.quiz = build_quiz(st.session_state.pos_mode)
         st.session_state.submitted = False
         st.session_state.wrong_list = []
         st.session_state.saved_this_attempt = False
+        st.session_state.challenge_id = None
         st.session_state.quiz_version += 1
         st.rerun()
 
@@ -518,6 +933,22 @@ with col2:
         st.session_state.quiz_version += 1
         st.rerun()
 
+today = today_kst().isoformat()
+today_challenge_id = make_challenge_id(today, LEVEL, st.session_state.pos_mode, vocab_store.current().version)
+if st.session_state.challenge_id == today_challenge_id:
+    st.caption(f"📅 오늘의 챌린지 진행 중 ({mode_label_map[st.session_state.pos_mode]})")
+elif st.button("📅 오늘의 챌린지 (모두 같은 10문항)", use_container_width=True):
+    use_latest_vocab()
+    # 고정한 스냅샷 버전으로 id를 다시 만든다 (그 사이 교체됐어도 퀴즈와 id가 어긋나지 않게)
+    challenge_id = make_challenge_id(today, LEVEL, st.session_state.pos_mode, st.session_state.vocab.version)
+    st.session_state.quiz = get_daily_challenge(challenge_id)
+    st.session_state.submitted = False
+    st.session_state.wrong_list = []
+    st.session_state.saved_this_attempt = False
+    st.session_state.challenge_id = challenge_id
+    st.session_state.quiz_version += 1
+    st.rerun()
+
 st.divider()
 
 # ============================================================
@@ -611,7 +1042,13 @@ if st.session_state.submitted:
                     pos_mode=st.session_state.pos_mode,
                     quiz_len=quiz_len,
                     score=score,
-                    wrong_list=wrong_list,
+                    wrong_list=encode_wrong_list(st.session_state.quiz, st.session_state.answers),
+                    # secrets SAVE_WORD_IDS = true 는 sql/word_difficulty.sql 적용 후에만
+                    word_ids=(
+                        [q["word_id"] for q in st.session_state.quiz]
+                        if st.secrets.get("SAVE_WORD_IDS", False) else None
+                    ),
+                    challenge_id=st.session_state.challenge_id,
                 )
                 st.session_state.saved_this_attempt = True
             except Exception as e:
@@ -747,6 +1184,12 @@ if st.session_state.submitted:
                     # 진행바는 streamlit 컴포넌트가 더 예쁨
                     st.progress(min(max(pct / 100.0, 0.0), 1.0))
                     st.caption(f"정답률 {pct:.0f}%")
+
+                    # ✅ DB에 저장된 오답(v0/v1)을 현재 단어장 기준 표시 형태로 복원
+                    if wrong:
+                        with st.expander(f"오답 보기 ({wrong}개)"):
+                            for w in decode_wrong_list(r["wrong_list"], df, FORMS):
+                                render_wrong_entry(w)
                     st.write("")  # 카드 사이 여백
 
                 # (선택) “표로 보기” 토글
@@ -770,15 +1213,25 @@ if st.session_state.submitted:
             st.info("기록을 불러오지 못했습니다. (DB/RLS 확인 필요)")
             st.write(getattr(e, "args", e))
 
+        if st.session_state.challenge_id:
+            st.divider()
+            render_challenge_stats(sb_authed, st.session_state.challenge_id)
+
+        st.divider()
+        render_leaderboard(sb_authed, user_id)
+
 
     # ✅ 세션 누적 통계(원래 기능 유지)
-    st.session_state.history.append({"mode": st.session_state.pos_mode, "score": score, "total": quiz_len})
+    #    제출 화면은 rerun(새로고침 복원/랭킹 기간 토글 등)마다 다시 그려지므로 퀴즈당 1번만 집계
+    if st.session_state.counted_quiz_version != st.session_state.quiz_version:
+        st.session_state.counted_quiz_version = st.session_state.quiz_version
+        st.session_state.history.append({"mode": st.session_state.pos_mode, "score": score, "total": quiz_len})
 
-    for idx, q in enumerate(st.session_state.quiz):
-        word = q["jp_word"]
-        st.session_state.total_counter[word] = st.session_state.total_counter.get(word, 0) + 1
-        if st.session_state.answers[idx] != q["correct_text"]:
-            st.session_state.wrong_counter[word] = st.session_state.wrong_counter.get(word, 0) + 1
+        for idx, q in enumerate(st.session_state.quiz):
+            word = q["jp_word"]
+            st.session_state.total_counter[word] = st.session_state.total_counter.get(word, 0) + 1
+            if st.session_state.answers[idx] != q["correct_text"]:
+                st.session_state.wrong_counter[word] = st.session_state.wrong_counter.get(word, 0) + 1
 
     # ✅ 오답 있을 때만: 오답 재도전 + 오답 노트
     if st.session_state.wrong_list:
@@ -789,26 +1242,12 @@ if st.session_state.submitted:
             st.session_state.submitted = False
             st.session_state.wrong_list = []
             st.session_state.saved_this_attempt = False
+            st.session_state.challenge_id = None
             st.session_state.quiz_version += 1
             st.rerun()
 
         for w in st.session_state.wrong_list:
-            st.markdown(
-                f"""
-**Q{w['No']}**
-
-- 문제: {w['문제']}
-- ❌ 내 답: **{w['내 답']}**
-- ✅ 정답: **{w['정답']}**
-
-📌 단어 정리  
-- 표기: **{w['단어']}**  
-- 읽기: {w['읽기']}  
-- 뜻: {w['뜻']}
-
----
-"""
-            )
+            render_wrong_entry(w)
 
     # ✅ 누적 현황(이번 세션)
     st.divider()
@@ -840,3 +1279,20 @@ if st.session_state.submitted:
 
     # ✅ 제출 후 상담 배너
     render_naver_talk()
+
+
+# ============================================================
+# ✅ 매 rerun 끝: 세션 스냅샷 저장 (디바운스 → 실제 쓰기는 백그라운드에서 모아서)
+#    + 새로고침 복구용 쿠키 토큰 (바뀐 경우만)
+# ============================================================
+save_session_snapshot()
+save_quiz_cookie()
+
+if session_backend is not None and st.secrets.get("SHOW_DEBUG", False):
+    with st.expander("세션 저장 상태(관리자/디버그용)"):
+        st.json(session_backend.summary())
+        st.json({
+            "vocab_current": f"{vocab_store.current().version:08x}",
+            "vocab_session": f"{st.session_state.vocab.version:08x}",
+            "vocab_live": [f"{v:08x}" for v in vocab_store.live_versions()],
+        })
@@ -0,0 +1,100 @@
+"""
+quiz_attempts.wrong_list v0 → v1 백필
+
+사용:
+    python scripts/backfill_wrong_list.py --dry-run   # 변환/크기 측정만
+    python scripts/backfill_wrong_list.py             # 실제 UPDATE
+
+.env (또는 환경변수):
+    SUPABASE_URL
+    SUPABASE_SERVICE_ROLE_KEY   # RLS 우회용 (anon 키로는 남의 행을 못 고친다)
+
+- id 기준 키셋 페이지네이션 → 몇 번을 다시 돌려도 안전 (이미 v1인 행은 건너뜀)
+- 단어장에서 못 찾는 항목이 있는 행은 v0 그대로 둔다 (skipped로 집계)
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from supabase import create_client
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.vocab import load_vocab  # noqa: E402
+from src.wrong_codec import compact_from_legacy, is_compact  # noqa: E402
+
+CSV_PATH = BASE_DIR / "data" / "words_adj_300.csv"
+
+
+def stored_size(obj) -> int:
+    """jsonb에 실제로 들어가는 크기(대략): UTF-8"""
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def wire_size(obj) -> int:
+    """insert 요청 바디 크기: supabase-py(httpx)는 ensure_ascii=True로 직렬화 → 한글 1자 = 6바이트"""
+    return len(json.dumps(obj).encode("utf-8"))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--batch", type=int, default=500)
+    args = ap.parse_args()
+
+    load_dotenv()
+    sb = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_ROLE_KEY"])
+    vocab = load_vocab(CSV_PATH)
+
+    last_id = None
+    stats = {"rows": 0, "converted": 0, "skipped": 0, "already_v1": 0}
+    before = {"stored": 0, "wire": 0}
+    after = {"stored": 0, "wire": 0}
+
+    while True:
+        q = sb.table("quiz_attempts").select("id, wrong_list").order("id").limit(args.batch)
+        if last_id is not None:
+            q = q.gt("id", last_id)
+        rows = q.execute().data
+        if not rows:
+            break
+
+        for r in rows:
+            last_id = r["id"]
+            stats["rows"] += 1
+            wl = r["wrong_list"]
+
+            if is_compact(wl):
+                stats["already_v1"] += 1
+                continue
+
+            compact = compact_from_legacy(wl or [], vocab)
+            if compact is None:
+                stats["skipped"] += 1
+                continue
+
+            stats["converted"] += 1
+            before["stored"] += stored_size(wl)
+            before["wire"] += wire_size(wl)
+            after["stored"] += stored_size(compact)
+            after["wire"] += wire_size(compact)
+
+            if not args.dry_run:
+                sb.table("quiz_attempts").update({"wrong_list": compact}).eq("id", r["id"]).execute()
+
+        print(f"... {stats['rows']} rows (last id={last_id})")
+
+    print(stats)
+    n = stats["converted"]
+    if n:
+        for key, label in [("stored", "평균 jsonb 크기"), ("wire", "평균 insert 바디(wrong_list)")]:
+            b, a = before[key] / n, after[key] / n
+            print(f"{label}: {b:.0f}B → {a:.0f}B ({(1 - a / b) * 100:.0f}% 감소)")
+
+
+if __name__ == "__main__":
+    main()
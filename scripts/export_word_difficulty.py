@@ -0,0 +1,144 @@
+"""
+단어별 난이도(전체 학습자) 내보내기
+
+사용:
+    python scripts/export_word_difficulty.py out.csv
+    python scripts/export_word_difficulty.py out.parquet --resume   # 중단된 곳부터 이어서
+
+.env (또는 환경변수):
+    SUPABASE_URL
+    SUPABASE_SERVICE_ROLE_KEY   # RLS 우회용 (전체 유저 기록 조회)
+
+- quiz_attempts를 id 키셋 페이지네이션으로 청크 단위 스트리밍 (전체를 DataFrame에 올리지 않음)
+- 집계는 word_id → (출제, 오답) 카운터만 유지 → 메모리는 단어 수에 비례 (기록 수와 무관)
+- 청크마다 체크포인트(마지막 id + 카운터) 저장 → --resume 으로 이어서
+- sql/word_difficulty.sql 적용 필요 (word_ids 컬럼을 조회함)
+- seen/missed/miss_rate는 word_ids가 있는 기록만으로 계산
+  word_ids가 비어 있는 기록(적용 전 / SAVE_WORD_IDS 꺼짐)은 출제 목록을 몰라 비율을 낼 수 없으므로
+  오답 수만 missed_legacy 컬럼에 따로 (비율에 섞으면 그 기록의 오답률이 항상 1.0이 된다)
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from supabase import create_client
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.vocab import load_vocab  # noqa: E402
+from src.wrong_codec import is_compact  # noqa: E402
+
+CSV_PATH = BASE_DIR / "data" / "words_adj_300.csv"
+
+
+def load_checkpoint(path: Path) -> dict:
+    state = json.loads(path.read_text(encoding="utf-8"))
+    # JSON 키는 문자열 → word_id(int)로 되돌림
+    state["seen"] = {int(k): v for k, v in state["seen"].items()}
+    state["missed"] = {int(k): v for k, v in state["missed"].items()}
+    state["missed_legacy"] = {int(k): v for k, v in state.get("missed_legacy", {}).items()}
+    return state
+
+
+def save_checkpoint(path: Path, state: dict):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def missed_word_ids(wrong_list, word_id_by_jp: dict, state: dict) -> list:
+    """v0/v1 wrong_list → 틀린 word_id 목록 (단어장에 없는 v0 단어는 unmatched로 집계)"""
+    if is_compact(wrong_list):
+        return [e[1] for e in wrong_list["w"]]
+
+    out = []
+    for w in wrong_list or []:
+        word_id = word_id_by_jp.get(w.get("단어"))
+        if word_id is None:
+            state["unmatched"] += 1
+        else:
+            out.append(word_id)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("out", help="결과 파일 (.csv 또는 .parquet)")
+    ap.add_argument("--chunk", type=int, default=1000)
+    ap.add_argument("--checkpoint", default="word_difficulty.checkpoint.json")
+    ap.add_argument("--resume", action="store_true")
+    ap.add_argument("--min-seen", type=int, default=1)
+    args = ap.parse_args()
+
+    load_dotenv()
+    sb = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_ROLE_KEY"])
+    vocab = load_vocab(CSV_PATH)
+    word_id_by_jp = {w: int(i) for i, w in zip(vocab["word_id"], vocab["jp_word"])}
+
+    ckpt = Path(args.checkpoint)
+    if args.resume and ckpt.exists():
+        state = load_checkpoint(ckpt)
+        print(f"resume from id > {state['last_id']} ({state['rows']} rows done)")
+    else:
+        state = {"last_id": None, "rows": 0, "rows_without_word_ids": 0, "unmatched": 0,
+                 "seen": {}, "missed": {}, "missed_legacy": {}}
+
+    seen, missed, missed_legacy = state["seen"], state["missed"], state["missed_legacy"]
+
+    while True:
+        q = (
+            sb.table("quiz_attempts")
+            .select("id, word_ids, wrong_list")
+            .order("id")
+            .limit(args.chunk)
+        )
+        if state["last_id"] is not None:
+            q = q.gt("id", state["last_id"])
+        rows = q.execute().data
+        if not rows:
+            break
+
+        for r in rows:
+            wrong_ids = missed_word_ids(r["wrong_list"], word_id_by_jp, state)
+            word_ids = r.get("word_ids")
+
+            if not word_ids:
+                state["rows_without_word_ids"] += 1
+                for word_id in wrong_ids:
+                    missed_legacy[word_id] = missed_legacy.get(word_id, 0) + 1
+                continue
+
+            for word_id in word_ids:
+                seen[word_id] = seen.get(word_id, 0) + 1
+            for word_id in wrong_ids:
+                missed[word_id] = missed.get(word_id, 0) + 1
+
+        state["rows"] += len(rows)
+        state["last_id"] = rows[-1]["id"]
+        save_checkpoint(ckpt, state)
+        print(f"... {state['rows']} rows (last id={state['last_id']})")
+
+    out = vocab[["word_id", "level", "pos", "jp_word", "reading", "meaning"]].copy()
+    out["seen"] = out["word_id"].map(seen).fillna(0).astype(int)
+    out["missed"] = out["word_id"].map(missed).fillna(0).astype(int)
+    out["missed_legacy"] = out["word_id"].map(missed_legacy).fillna(0).astype(int)
+    out = out[(out["seen"] >= args.min_seen) | (out["missed_legacy"] > 0)]
+    # 출제 기록이 min-seen 미만이면 비율은 비워둔다 (legacy 오답만 있는 단어)
+    out["miss_rate"] = (out["missed"] / out["seen"]).where(out["seen"] >= args.min_seen).round(4)
+    out = out.sort_values(["miss_rate", "missed", "missed_legacy"], ascending=False, na_position="last")
+
+    if args.out.endswith(".parquet"):
+        out.to_parquet(args.out, index=False)  # pyarrow 필요
+    else:
+        out.to_csv(args.out, index=False, encoding="utf-8-sig")  # 엑셀에서 한글/일본어 안 깨지게
+
+    print({k: state[k] for k in ("rows", "rows_without_word_ids", "unmatched")})
+    print(f"{len(out)} words → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+-- ============================================================
+-- 오늘의 챌린지: quiz_attempts.challenge_id + 문항별 정답률 증분 집계
+--   challenge_id = 'YYYY-MM-DD:레벨:유형:단어장버전' (예: 2026-10-19:N4:mix:1a2b3c4d)
+--   단어장이 하루 중간에 바뀌면 버전이 달라져 문항별 통계도 따로 쌓인다
+--   유저별 첫 응시만 집계 (재도전으로 정답률이 부풀지 않게)
+-- Supabase SQL Editor에서 1회 실행 (wrong_list v1 압축 형식 기준)
+-- ============================================================
+
+alter table public.quiz_attempts add column if not exists challenge_id text;
+
+create index if not exists quiz_attempts_challenge_user_idx
+  on public.quiz_attempts (challenge_id, user_id)
+  where challenge_id is not null;
+
+create table if not exists public.challenge_question_stats (
+  challenge_id text not null,
+  q_no         int  not null,
+  seen         int  not null default 0,
+  correct      int  not null default 0,
+  primary key (challenge_id, q_no)
+);
+
+create or replace function public.bump_challenge_stats()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  wrong_nos int[];
+begin
+  if new.challenge_id is null then
+    return new;
+  end if;
+
+  -- 같은 챌린지 재응시는 집계 X
+  if exists (
+    select 1 from quiz_attempts
+    where challenge_id = new.challenge_id and user_id = new.user_id and id <> new.id
+  ) then
+    return new;
+  end if;
+
+  -- v1: {"v": 1, "w": [[No, word_id, qtype, picked_id], ...]}
+  select coalesce(array_agg((e ->> 0)::int), '{}')
+    into wrong_nos
+  from jsonb_array_elements(coalesce(new.wrong_list -> 'w', '[]'::jsonb)) as e;
+
+  insert into challenge_question_stats as s (challenge_id, q_no, seen, correct)
+  select new.challenge_id, n, 1, case when n = any(wrong_nos) then 0 else 1 end
+  from generate_series(1, new.quiz_len) as n
+  on conflict (challenge_id, q_no) do update set
+    seen    = s.seen + 1,
+    correct = s.correct + excluded.correct;
+
+  return new;
+end;
+$$;
+
+drop trigger if exists quiz_attempts_bump_challenge_stats on public.quiz_attempts;
+create trigger quiz_attempts_bump_challenge_stats
+  after insert on public.quiz_attempts
+  for each row execute function public.bump_challenge_stats();
+
+alter table public.challenge_question_stats enable row level security;
+
+drop policy if exists "read challenge stats" on public.challenge_question_stats;
+create policy "read challenge stats" on public.challenge_question_stats
+  for select to authenticated using (true);
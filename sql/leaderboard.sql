@@ -0,0 +1,140 @@
+-- ============================================================
+-- 리더보드/반(코호트) 통계: quiz_attempts INSERT 시 증분 집계
+--   - user_period_stats : 유저 × 기간(week/month) × 레벨 1행
+--   - cohort_period_stats: 기간 × 레벨 1행 (전체 합계)
+-- 조회는 이 두 작은 테이블만 읽는다 (quiz_attempts 풀스캔 X)
+-- Supabase SQL Editor에서 1회 실행
+-- ============================================================
+
+create table if not exists public.user_period_stats (
+  user_id        uuid        not null,
+  period_type    text        not null check (period_type in ('week', 'month')),
+  period_start   date        not null,
+  level          text        not null,
+  display_name   text        not null,
+  attempts       int         not null default 0,
+  total_questions int        not null default 0,
+  total_correct  int         not null default 0,
+  best_score     int         not null default 0,
+  updated_at     timestamptz not null default now(),
+  primary key (period_type, period_start, level, user_id)
+);
+
+create index if not exists user_period_stats_rank_idx
+  on public.user_period_stats (period_type, period_start, level, total_correct desc);
+
+create table if not exists public.cohort_period_stats (
+  period_type    text   not null check (period_type in ('week', 'month')),
+  period_start   date   not null,
+  level          text   not null,
+  learners       int    not null default 0,
+  attempts       int    not null default 0,
+  total_questions int   not null default 0,
+  total_correct  int    not null default 0,
+  primary key (period_type, period_start, level)
+);
+
+-- 이메일 앞 3글자만 노출 (abc***)
+create or replace function public.mask_display_name(uid uuid)
+returns text
+language sql
+stable
+security definer
+set search_path = public
+as $$
+  select coalesce(left(split_part(u.email, '@', 1), 3), 'user') || '***'
+  from auth.users u
+  where u.id = uid
+$$;
+
+create or replace function public.bump_period_stats()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  p text;
+  p_start date;
+  is_new boolean;
+begin
+  foreach p in array array['week', 'month'] loop
+    p_start := date_trunc(p, new.created_at at time zone 'Asia/Seoul')::date;
+
+    insert into user_period_stats as s
+      (user_id, period_type, period_start, level, display_name,
+       attempts, total_questions, total_correct, best_score)
+    values
+      (new.user_id, p, p_start, new.level, mask_display_name(new.user_id),
+       1, new.quiz_len, new.score, new.score)
+    on conflict (period_type, period_start, level, user_id) do update set
+      attempts        = s.attempts + 1,
+      total_questions = s.total_questions + excluded.total_questions,
+      total_correct   = s.total_correct + excluded.total_correct,
+      best_score      = greatest(s.best_score, excluded.best_score),
+      updated_at      = now()
+    returning (xmax = 0) into is_new;   -- xmax=0 → 이번에 새로 INSERT된 행 (= 이 기간 첫 응시)
+
+    insert into cohort_period_stats as c
+      (period_type, period_start, level, learners, attempts, total_questions, total_correct)
+    values
+      (p, p_start, new.level, 1, 1, new.quiz_len, new.score)
+    on conflict (period_type, period_start, level) do update set
+      learners        = c.learners + case when is_new then 1 else 0 end,
+      attempts        = c.attempts + 1,
+      total_questions = c.total_questions + excluded.total_questions,
+      total_correct   = c.total_correct + excluded.total_correct;
+  end loop;
+
+  return new;
+end;
+$$;
+
+-- RLS: 로그인 유저는 누구나 읽기만 가능 (쓰기는 트리거만)
+alter table public.user_period_stats enable row level security;
+alter table public.cohort_period_stats enable row level security;
+
+drop policy if exists "read leaderboard" on public.user_period_stats;
+create policy "read leaderboard" on public.user_period_stats
+  for select to authenticated using (true);
+
+drop policy if exists "read cohort" on public.cohort_period_stats;
+create policy "read cohort" on public.cohort_period_stats
+  for select to authenticated using (true);
+
+-- ============================================================
+-- 기존 기록 1회 적재 + 트리거 설치 (한 트랜잭션)
+--   quiz_attempts를 잠가 적재~트리거 생성 사이에 들어오는 INSERT를 막는다
+--   (틈이 있으면 그 사이 응시가 부분 행을 만들고, 아래 on conflict do nothing이 과거 기록을 건너뜀)
+-- ============================================================
+begin;
+
+lock table public.quiz_attempts in share row exclusive mode;
+
+insert into public.user_period_stats
+  (user_id, period_type, period_start, level, display_name,
+   attempts, total_questions, total_correct, best_score)
+select
+  a.user_id, p.period_type,
+  date_trunc(p.period_type, a.created_at at time zone 'Asia/Seoul')::date,
+  a.level, public.mask_display_name(a.user_id),
+  count(*), sum(a.quiz_len), sum(a.score), max(a.score)
+from public.quiz_attempts a
+cross join (values ('week'), ('month')) as p(period_type)
+group by 1, 2, 3, 4
+on conflict do nothing;
+
+insert into public.cohort_period_stats
+  (period_type, period_start, level, learners, attempts, total_questions, total_correct)
+select period_type, period_start, level,
+       count(*), sum(attempts), sum(total_questions), sum(total_correct)
+from public.user_period_stats
+group by 1, 2, 3
+on conflict do nothing;
+
+drop trigger if exists quiz_attempts_bump_period_stats on public.quiz_attempts;
+create trigger quiz_attempts_bump_period_stats
+  after insert on public.quiz_attempts
+  for each row execute function public.bump_period_stats();
+
+commit;
@@ -0,0 +1,9 @@
+-- ============================================================
+-- 단어별 난이도 집계용: 시도마다 출제된 word_id 전체 저장
+--   wrong_list에는 틀린 문제만 있어서 "출제 횟수(seen)"를 알 수 없었음
+--   scripts/export_word_difficulty.py 가 id 키셋 페이지네이션으로 읽는다 (PK 인덱스 사용)
+-- Supabase SQL Editor에서 1회 실행 → 그 다음 앱 secrets에 SAVE_WORD_IDS = true
+--   (그 전에는 앱이 word_ids를 보내지 않는다: 없는 컬럼이면 PostgREST가 INSERT 자체를 거부하므로)
+-- ============================================================
+
+alter table public.quiz_attempts add column if not exists word_ids smallint[];
@@ -0,0 +1,64 @@
+"""
+형용사 활용형 미리 계산 (단어장 1개당 1번)
+
+forms = build_form_table(vocab) → {word_id: {"neg": "忙しくない", "past": ..., ...}}
+문제 출제 시에는 이 표를 조회만 한다 (렌더마다 문자열 가공 X)
+"""
+
+# ⚠️ 순서 = 저장되는 보기 id (활용형 문제는 보기 id가 word_id가 아니라 이 인덱스)
+CONJ_FORMS = ["neg", "past", "past_neg", "te", "adv"]
+
+CONJ_LABELS = {
+    "neg": "부정형(~ない)",
+    "past": "과거형",
+    "past_neg": "과거부정형",
+    "te": "て형",
+    "adv": "부사형",
+}
+
+_I_ENDINGS = {"neg": "くない", "past": "かった", "past_neg": "くなかった", "te": "くて", "adv": "く"}
+_NA_ENDINGS = {"neg": "じゃない", "past": "だった", "past_neg": "じゃなかった", "te": "で", "adv": "に"}
+
+# いい → よ(くない/かった/...)  ※ かわいい 같은 보통 い형용사와 구분하려고 목록으로 관리
+IRREGULAR_II = ["かっこいい", "格好いい", "気持ちいい", "頭がいい", "仲がいい", "いい"]
+
+# 규칙대로 만들면 틀리는 개별 활용형 (어간 기준, 규칙 결과를 덮어쓴다)
+FORM_OVERRIDES = {
+    "同じ": {"adv": "同じように"},   # 同じに X (な형용사 규칙 예외)
+    "おなじ": {"adv": "おなじように"},
+}
+
+# い로 끝나지만 な형용사인 단어 (단어장에 i_adj로 잘못 들어가 있어도 な로 활용)
+NA_ENDING_IN_I = {"きれい", "綺麗", "嫌い", "きらい"}
+
+
+def conjugate(word: str, pos: str):
+    """활용형 dict, 활용할 수 없는 형태면 None"""
+    if not isinstance(word, str) or not word:
+        return None
+
+    if pos == "na_adj" or word in NA_ENDING_IN_I:
+        stem = word[:-1] if word.endswith("だ") else word
+        forms = {form: stem + _NA_ENDINGS[form] for form in CONJ_FORMS}
+        forms.update(FORM_OVERRIDES.get(stem, {}))
+        return forms
+
+    if pos != "i_adj" or not word.endswith("い"):
+        return None
+
+    if word in IRREGULAR_II:
+        stem = word[:-2] + "よ"
+    else:
+        stem = word[:-1]
+    forms = {form: stem + _I_ENDINGS[form] for form in CONJ_FORMS}
+    forms.update(FORM_OVERRIDES.get(word, {}))
+    return forms
+
+
+def build_form_table(vocab) -> dict:
+    table = {}
+    for word_id, word, pos in zip(vocab["word_id"], vocab["jp_word"], vocab["pos"]):
+        forms = conjugate(word, pos)
+        if forms is not None:
+            table[int(word_id)] = forms
+    return table
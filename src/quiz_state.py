@@ -0,0 +1,48 @@
+"""
+퀴즈 상태 ↔ 단어 id 기반 압축 형태
+
+문제 하나 = (word_id, qtype, 보기 id 4개) 만 있으면 단어장(+활용형 표)에서 나머지를 전부 복원할 수 있다.
+(보기 id: 발음/뜻 문제는 word_id, 활용형 문제는 CONJ_FORMS 인덱스)
+packed = {"q": [[word_id, qtype_code, [choice_id x4]], ...], "a": [고른 보기 위치 or -1, ...]}
+"""
+from src.wrong_codec import PROMPT_FORMATS, QTYPE_BY_CODE, QTYPE_CODES, choice_text, correct_choice_id
+
+
+def question_from_ids(vocab, word_id: int, qtype: str, choice_ids: list, forms=None) -> dict:
+    """vocab: src/vocab.load_vocab 결과 (index == word_id), forms: 활용형 표 (활용형 문제일 때)"""
+    row = vocab.loc[word_id]
+    choices = [choice_text(vocab, forms, qtype, word_id, cid) for cid in choice_ids]
+    if None in choices:
+        raise KeyError(f"unknown choice id: {choice_ids}")
+    return {
+        "prompt": PROMPT_FORMATS[qtype].format(row["jp_word"]),
+        "qtype": qtype,
+        "choices": choices,
+        "choice_ids": [int(cid) for cid in choice_ids],
+        "correct_text": choice_text(vocab, forms, qtype, word_id, correct_choice_id(qtype, word_id)),
+        "word_id": int(word_id),
+        "jp_word": row["jp_word"],
+        "reading": row["reading"],
+        "meaning": row["meaning"],
+        "pos": row["pos"],
+    }
+
+
+def pack_quiz(quiz: list, answers: list) -> dict:
+    return {
+        "q": [[q["word_id"], QTYPE_CODES[q["qtype"]], q["choice_ids"]] for q in quiz],
+        "a": [
+            q["choices"].index(a) if a in q["choices"] else -1
+            for q, a in zip(quiz, answers)
+        ],
+    }
+
+
+def unpack_quiz(packed: dict, vocab, forms=None):
+    """→ (quiz, answers). 단어장에 없는 id가 있으면 KeyError"""
+    quiz = [
+        question_from_ids(vocab, word_id, QTYPE_BY_CODE[code], choice_ids, forms)
+        for word_id, code, choice_ids in packed["q"]
+    ]
+    answers = [q["choices"][i] if i >= 0 else None for q, i in zip(quiz, packed["a"])]
+    return quiz, answers
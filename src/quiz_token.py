@@ -0,0 +1,71 @@
+"""
+진행 중인 퀴즈 → 쿠키에 넣을 작은 토큰 (새로고침 복구용)
+
+바이너리 레이아웃 (big-endian) → base64url
+  header : version(B) user_crc(I) vocab_version(I) mode(B) flags(B) challenge_day(H) quiz_version(H) n(B)
+  문제 n개: word_id(H) qtype(B) choice_id x4(4H) answer(b, -1 = 미선택)
+
+- 보기 word_id 4개 = 오답 후보 + 보기 순서(permutation)까지 그대로 → 복원 시 재생성/DB 조회 없음
+- user_crc: 같은 브라우저에서 다른 계정으로 로그인했을 때 남의 퀴즈를 복원하지 않도록
+- vocab_version: 퀴즈를 만든 단어장 스냅샷 (src/vocab.vocab_version)
+- challenge_day: 1970-01-01부터 일수 (0 = 챌린지 아님)
+"""
+import base64
+import struct
+import zlib
+
+TOKEN_VERSION = 2
+
+_HEADER = struct.Struct(">BIIBBHHB")
+_QUESTION = struct.Struct(">HB4Hb")
+
+FLAG_SUBMITTED = 1
+FLAG_SAVED = 2
+
+
+def user_crc(user_id) -> int:
+    return zlib.crc32(str(user_id).encode("utf-8"))
+
+
+def encode_quiz_token(packed: dict, user_id, vocab_version: int, mode: int, quiz_version: int,
+                      submitted=False, saved=False, challenge_day=0) -> str:
+    """packed: src/quiz_state.pack_quiz() 결과"""
+    flags = (FLAG_SUBMITTED if submitted else 0) | (FLAG_SAVED if saved else 0)
+    parts = [_HEADER.pack(
+        TOKEN_VERSION, user_crc(user_id), vocab_version, mode, flags,
+        challenge_day, quiz_version & 0xFFFF, len(packed["q"]),
+    )]
+    for (word_id, code, choice_ids), answer in zip(packed["q"], packed["a"]):
+        parts.append(_QUESTION.pack(word_id, code, *choice_ids, answer))
+    return base64.urlsafe_b64encode(b"".join(parts)).decode("ascii").rstrip("=")
+
+
+def decode_quiz_token(token: str, user_id):
+    """형식이 깨졌거나 다른 유저/버전 토큰이면 None"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        version, crc, vocab_version, mode, flags, challenge_day, quiz_version, n = _HEADER.unpack_from(raw, 0)
+        if version != TOKEN_VERSION or crc != user_crc(user_id):
+            return None
+        if len(raw) != _HEADER.size + n * _QUESTION.size:
+            return None
+
+        q, a = [], []
+        for i in range(n):
+            word_id, code, c0, c1, c2, c3, answer = _QUESTION.unpack_from(raw, _HEADER.size + i * _QUESTION.size)
+            q.append([word_id, code, [c0, c1, c2, c3]])
+            a.append(answer)
+    except (ValueError, struct.error):
+        return None
+
+    return {
+        "packed": {"q": q, "a": a},
+        "vocab_version": vocab_version,
+        "mode": mode,
+        "quiz_version": quiz_version,
+        "submitted": bool(flags & FLAG_SUBMITTED),
+        "saved": bool(flags & FLAG_SAVED),
+        "challenge_day": challenge_day,
+    }
@@ -0,0 +1,196 @@
+"""
+세션 상태 외부 저장소 (여러 레플리카 / 재시작 후에도 진행 중인 퀴즈 이어가기)
+
+- SessionStore: get/put/delete (bytes) 만 구현하면 백엔드 교체 가능
+    - SQLiteSessionStore: WAL 모드 SQLite 파일 (공유 볼륨에 두면 레플리카끼리 공유)
+    - FileSessionStore  : 키마다 파일 1개, 임시파일 → rename 으로 원자적 교체
+- SessionStateBackend: 스냅샷 인코딩(JSON+zlib) + 중복 스킵 + 디바운스 쓰기 + 크기/시간 측정
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore(ABC):
+    @abstractmethod
+    def get(self, key: str):
+        ...
+
+    @abstractmethod
+    def put(self, key: str, blob: bytes):
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+
+class SQLiteSessionStore(SessionStore):
+    def __init__(self, path):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as con, con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS session_snapshots ("
+                " key TEXT PRIMARY KEY, blob BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        # 스레드마다/호출마다 새 연결 (디바운스 쓰기는 타이머 스레드에서 돈다)
+        # ⚠️ `with con:`은 commit만 하고 닫지 않는다 → 항상 closing()으로 감싸서 쓸 것
+        con = sqlite3.connect(self.path, timeout=5)
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def get(self, key):
+        with closing(self._connect()) as con, con:
+            row = con.execute("SELECT blob FROM session_snapshots WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, blob):
+        with closing(self._connect()) as con, con:
+            con.execute(
+                "INSERT INTO session_snapshots (key, blob, updated_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET blob = excluded.blob, updated_at = excluded.updated_at",
+                (key, blob, time.time()),
+            )
+
+    def delete(self, key):
+        with closing(self._connect()) as con, con:
+            con.execute("DELETE FROM session_snapshots WHERE key = ?", (key,))
+
+
+class FileSessionStore(SessionStore):
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key):
+        return self.root / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".bin")
+
+    def get(self, key):
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, blob):
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+
+    def delete(self, key):
+        self._path(key).unlink(missing_ok=True)
+
+
+def encode_snapshot(obj) -> bytes:
+    return zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_snapshot(blob: bytes):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class SessionStateBackend:
+    """
+    save()는 바로 쓰지 않는다: 키별 최신 스냅샷만 들고 있다가 delay초 뒤 한 번에 flush (trailing debounce)
+    → 연속 클릭(rerun) 여러 번이 쓰기 1번으로 합쳐진다
+    """
+
+    def __init__(self, store: SessionStore, delay: float = 1.0):
+        self.store = store
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_digest = {}
+        self._timer = None
+        self.stats = {
+            "saves": 0, "skipped_same": 0, "writes": 0, "loads": 0,
+            "last_bytes": 0, "total_bytes": 0,
+            "encode_ms": 0.0, "write_ms": 0.0, "load_ms": 0.0,
+        }
+
+    def save(self, key: str, snapshot: dict):
+        t0 = time.perf_counter()
+        blob = encode_snapshot(snapshot)
+        digest = hashlib.sha1(blob).digest()
+        encode_ms = (time.perf_counter() - t0) * 1000
+
+        with self._lock:
+            self.stats["saves"] += 1
+            self.stats["encode_ms"] += encode_ms
+            self.stats["last_bytes"] = len(blob)
+            if self._last_digest.get(key) == digest:
+                self.stats["skipped_same"] += 1
+                return
+            self._last_digest[key] = digest
+            self._pending[key] = blob
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._timer = None
+
+        for key, blob in pending.items():
+            t0 = time.perf_counter()
+            try:
+                self.store.put(key, blob)
+            except Exception:
+                logger.exception("session snapshot write failed: %s", key)
+                with self._lock:
+                    self._last_digest.pop(key, None)
+                continue
+            write_ms = (time.perf_counter() - t0) * 1000
+            with self._lock:
+                self.stats["writes"] += 1
+                self.stats["total_bytes"] += len(blob)
+                self.stats["write_ms"] += write_ms
+            logger.debug("session snapshot %s: %dB, write %.2fms", key, len(blob), write_ms)
+
+    def load(self, key: str):
+        with self._lock:
+            blob = self._pending.get(key)
+        t0 = time.perf_counter()
+        if blob is None:
+            blob = self.store.get(key)
+        with self._lock:
+            self.stats["loads"] += 1
+            self.stats["load_ms"] += (time.perf_counter() - t0) * 1000
+        if blob is None:
+            return None
+        try:
+            return decode_snapshot(blob)
+        except Exception:
+            logger.warning("broken session snapshot ignored: %s", key)
+            return None
+
+    def delete(self, key: str):
+        with self._lock:
+            self._pending.pop(key, None)
+            self._last_digest.pop(key, None)
+        self.store.delete(key)
+
+    def summary(self) -> dict:
+        with self._lock:
+            s = dict(self.stats)
+        s["avg_write_bytes"] = s["total_bytes"] / s["writes"] if s["writes"] else 0
+        s["avg_encode_ms"] = s["encode_ms"] / s["saves"] if s["saves"] else 0
+        s["avg_write_ms"] = s["write_ms"] / s["writes"] if s["writes"] else 0
+        s["avg_load_ms"] = s["load_ms"] / s["loads"] if s["loads"] else 0
+        return s
@@ -0,0 +1,144 @@
+import io
+import logging
+import threading
+import time
+import weakref
+import zlib
+
+import pandas as pd
+
+from src.conjugation import build_form_table
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ["level", "pos", "jp_word", "reading", "meaning"]
+
+
+def load_vocab(path) -> pd.DataFrame:
+    with open(path, "rb") as f:
+        return parse_vocab(f.read())
+
+
+def parse_vocab(data: bytes) -> pd.DataFrame:
+    """
+    단어 CSV 바이트(탭 구분도 허용) 파싱 + 컬럼 정리 + word_id 부여
+    반환 DataFrame은 index == word_id (컬럼도 유지) → vocab.loc[word_id]로 조회
+
+    ⚠️ word_id = 파일 내 행 순서 (quiz_attempts.wrong_list에 저장됨)
+       → 단어 추가는 파일 끝에만! 중간 삽입/삭제/정렬하면 기존 기록이 엉뚱한 단어를 가리킨다.
+    """
+    df = pd.read_csv(io.BytesIO(data))
+    if len(df.columns) == 1 and "\t" in df.columns[0]:
+        df = pd.read_csv(io.BytesIO(data), sep="\t")
+
+    df.columns = df.columns.astype(str).str.replace("\ufeff", "", regex=False).str.strip()
+    df["word_id"] = range(len(df))
+    # index 이름은 비워둔다 (컬럼과 같은 이름이면 groupby/sort_values("word_id")가 모호하다고 에러)
+    return df.set_index("word_id", drop=False).rename_axis(None)
+
+
+def vocab_version(data: bytes) -> int:
+    """파일 내용 crc32 → 같은 파일이면 레플리카/재시작과 상관없이 같은 버전"""
+    return zlib.crc32(data)
+
+
+class VocabSnapshot:
+    """
+    한 번 만들어지면 바뀌지 않는 단어장 스냅샷 (df + 레벨별 pool + 활용형 표)
+    ⚠️ 여러 세션이 공유 → df/pools/forms는 읽기 전용으로만 (필요하면 .copy())
+    """
+
+    def __init__(self, version: int, df: pd.DataFrame):
+        self.version = version
+        self.df = df
+        self.pools = {level: g for level, g in df.groupby("level")}
+        self.forms = build_form_table(df)
+        self.loaded_at = time.time()
+
+
+class VocabStore:
+    """
+    단어장 파일 감시 + 무중단 교체
+
+    - 백그라운드 스레드가 interval초마다 mtime 확인 → 바뀌면 새 스냅샷을 다 만든 뒤 참조만 교체
+      (요청 처리 중에는 인덱스 재계산 X, 교체는 참조 대입 1번)
+    - 진행 중인 퀴즈는 자기가 만들어진 스냅샷을 계속 들고 있다 (세션이 강한 참조를 보유)
+    - 지난 스냅샷은 WeakValueDictionary로만 추적 → 어떤 세션도 안 쓰면 자동 해제
+    """
+
+    def __init__(self, path, interval: float = 5.0, min_words: int = 1):
+        """min_words: 레벨별·품사별 최소 단어 수 (못 채우면 교체하지 않음)"""
+        self.path = path
+        self.interval = interval
+        self.min_words = min_words
+        self._lock = threading.Lock()
+        self._versions = weakref.WeakValueDictionary()
+        self._mtime = None
+        self._current = None
+        self._reload()
+
+        t = threading.Thread(target=self._watch, name="vocab-watcher", daemon=True)
+        t.start()
+
+    def current(self) -> VocabSnapshot:
+        return self._current
+
+    def get(self, version: int):
+        """
+        그 버전 스냅샷이 아직 살아있으면 반환 (현재 버전 포함), 없으면 None
+        ⚠️ None일 때 current()로 대신 풀지 말 것: word_id가 다른 단어를 가리킬 수 있다
+        """
+        with self._lock:
+            return self._versions.get(version)
+
+    def live_versions(self) -> list:
+        with self._lock:
+            return sorted(self._versions.keys())
+
+    def _validate(self, df: pd.DataFrame):
+        """저장 도중 잘린 파일처럼 파싱은 되지만 출제가 안 되는 단어장이면 ValueError"""
+        missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"vocab missing columns: {missing}")
+
+        # 모드(i_adj/na_adj)마다 레벨별 N문항을 뽑으므로 (레벨, 품사) 단위로 확인
+        counts = df.groupby(["level", "pos"]).size()
+        short = counts[counts < self.min_words]
+        if len(short):
+            raise ValueError(f"vocab too small: {short.to_dict()}")
+
+        if self._current is not None:
+            old = set(self._current.df.groupby(["level", "pos"]).size().index)
+            gone = old - set(counts.index)
+            if gone:
+                raise ValueError(f"vocab lost level/pos groups: {sorted(gone)}")
+
+    def _reload(self):
+        mtime = self.path.stat().st_mtime
+        if mtime == self._mtime:
+            return
+
+        # 파일은 1번만 읽는다: 버전(crc32)과 내용이 항상 같은 바이트에서 나오도록
+        data = self.path.read_bytes()
+        version = vocab_version(data)
+        if self._current is not None and version == self._current.version:
+            self._mtime = mtime
+            return
+
+        df = parse_vocab(data)
+        self._validate(df)
+        snap = VocabSnapshot(version, df)
+        with self._lock:
+            self._versions[version] = snap
+            self._current = snap
+            self._mtime = mtime
+        logger.info("vocab snapshot swapped: version=%08x words=%d", version, len(snap.df))
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self._reload()
+            except Exception:
+                # 편집 중인(깨진/잘린) 파일, 검증 실패 등 → 이전 스냅샷 유지, 다음 주기에 재시도
+                logger.exception("vocab reload failed, keeping version %08x", self._current.version)
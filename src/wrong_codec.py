@@ -0,0 +1,129 @@
+"""
+quiz_attempts.wrong_list (jsonb) 압축 인코딩
+
+- v0 (기존): [{"No", "문제", "내 답", "정답", "단어", "읽기", "뜻"}, ...]  → 단어장 내용을 매번 통째로 복사
+- v1 (압축): {"v": 1, "w": [[No, word_id, qtype_code, picked_word_id], ...]}
+
+picked_word_id = 내가 고른 보기가 어느 단어의 값인지 (보기 순서는 저장하지 않으므로 위치 대신 단어 id)
+  (활용형 문제는 word_id 대신 같은 단어의 활용형 인덱스 = CONJ_FORMS 위치)
+못 찾으면 -1 → 디코딩 시 "내 답"은 None
+"""
+from src.conjugation import CONJ_FORMS, CONJ_LABELS
+
+WRONG_LIST_VERSION = 1
+
+# ⚠️ 코드값은 DB에 저장됨 → 추가만 하고 절대 바꾸지 말 것
+QTYPE_CODES = {"reading": 0, "meaning": 1, "neg": 2, "past": 3, "past_neg": 4, "te": 5, "adv": 6}
+QTYPE_BY_CODE = {v: k for k, v in QTYPE_CODES.items()}
+
+# 유형별 (문제 문구, 정답으로 쓰는 컬럼)  ※ 활용형 유형은 컬럼 대신 활용형 표(forms)에서 조회
+PROMPT_FORMATS = {
+    "reading": "{}의 발음은?",
+    "meaning": "{}의 뜻은?",
+    **{form: "{}의 " + label + "은?" for form, label in CONJ_LABELS.items()},
+}
+ANSWER_FIELDS = {
+    "reading": "reading",
+    "meaning": "meaning",
+}
+
+
+def correct_choice_id(qtype: str, word_id: int) -> int:
+    if qtype in ANSWER_FIELDS:
+        return int(word_id)
+    return CONJ_FORMS.index(qtype)
+
+
+def choice_text(vocab, forms, qtype: str, word_id: int, choice_id: int):
+    """보기 id → 화면 문자열 (없는 id면 None)"""
+    if qtype in ANSWER_FIELDS:
+        if choice_id not in vocab.index:
+            return None
+        return vocab.loc[choice_id, ANSWER_FIELDS[qtype]]
+    if not 0 <= choice_id < len(CONJ_FORMS) or not forms or word_id not in forms:
+        return None
+    return forms[word_id][CONJ_FORMS[choice_id]]
+
+
+def is_compact(wrong_list) -> bool:
+    return isinstance(wrong_list, dict) and wrong_list.get("v") == WRONG_LIST_VERSION
+
+
+def count_wrong(wrong_list) -> int:
+    if is_compact(wrong_list):
+        return len(wrong_list["w"])
+    return len(wrong_list or [])
+
+
+def encode_wrong_list(quiz: list, answers: list) -> dict:
+    """퀴즈 + 내 답 → v1 압축 wrong_list"""
+    entries = []
+    for idx, q in enumerate(quiz):
+        picked = answers[idx]
+        if picked == q["correct_text"]:
+            continue
+
+        picked_id = -1
+        if picked in q["choices"]:
+            picked_id = int(q["choice_ids"][q["choices"].index(picked)])
+
+        entries.append([idx + 1, int(q["word_id"]), QTYPE_CODES[q["qtype"]], picked_id])
+
+    return {"v": WRONG_LIST_VERSION, "w": entries}
+
+
+def decode_wrong_list(wrong_list, vocab, forms=None) -> list:
+    """
+    v0/v1 wrong_list → 화면 표시용(v0 형태) 리스트
+    vocab: word_id를 index로 둔 단어 DataFrame (현재 단어장 기준으로 복원)
+    forms: src/conjugation.build_form_table 결과 (활용형 문제가 있을 때 필요)
+    단어장에 없는 id는 choice_text와 같게 None으로 채운다 (예외 X)
+    """
+    if not is_compact(wrong_list):
+        return list(wrong_list or [])
+
+    out = []
+    for no, word_id, code, picked_id in wrong_list["w"]:
+        qtype = QTYPE_BY_CODE.get(code)
+        row = vocab.loc[word_id] if word_id in vocab.index else None
+        if qtype is None or row is None:
+            out.append({"No": no, "문제": None, "내 답": None, "정답": None, "단어": None, "읽기": None, "뜻": None})
+            continue
+
+        out.append({
+            "No": no,
+            "문제": PROMPT_FORMATS[qtype].format(row["jp_word"]),
+            "내 답": choice_text(vocab, forms, qtype, word_id, picked_id),
+            "정답": choice_text(vocab, forms, qtype, word_id, correct_choice_id(qtype, word_id)),
+            "단어": row["jp_word"],
+            "읽기": row["reading"],
+            "뜻": row["meaning"],
+        })
+    return out
+
+
+def compact_from_legacy(wrong_list: list, vocab):
+    """
+    v0 → v1 변환 (백필용)
+    단어/유형을 단어장에서 못 찾는 항목이 하나라도 있으면 None (그 행은 v0 그대로 둔다)
+    """
+    by_word = {w: i for i, w in zip(vocab.index, vocab["jp_word"])}
+    by_value = {
+        qtype: {v: i for i, v in zip(vocab.index, vocab[field])}
+        for qtype, field in ANSWER_FIELDS.items()
+    }
+
+    entries = []
+    for w in wrong_list:
+        word_id = by_word.get(w.get("단어"))
+        qtype = next(
+            (t for t in ANSWER_FIELDS if w.get("문제") == PROMPT_FORMATS[t].format(w.get("단어"))),
+            None,
+        )
+        if word_id is None or qtype is None:
+            return None
+
+        picked_id = by_value[qtype].get(w.get("내 답"), -1)
+        entries.append([int(w["No"]), int(word_id), QTYPE_CODES[qtype], int(picked_id)])
+
+    return {"v": WRONG_LIST_VERSION, "w": entries}